@@ -4,19 +4,25 @@ import json
 import subprocess
 import ctypes
 import tempfile
+import time
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QPushButton, QVBoxLayout,
     QFileDialog, QListWidget, QListWidgetItem, QMessageBox, QHBoxLayout,
-    QSplitter, QFrame, QSizePolicy
+    QSplitter, QFrame, QSizePolicy, QSystemTrayIcon, QMenu
 )
-from PyQt5.QtGui import QIcon, QPixmap, QFont, QCursor, QColor, QPainter, QTransform
-from PyQt5.QtCore import Qt, QPoint, QSize, QTimer, QRectF
+from PyQt5.QtGui import (
+    QIcon, QPixmap, QFont, QCursor, QColor, QPainter, QTransform, QPixmapCache
+)
+from PyQt5.QtCore import Qt, QPoint, QSize, QTimer, QRectF, QEvent
 
 
 GAMES_FILE = 'games.json'
 FAV_FILE = 'favorites.json'
 ADD_ICON = '+'
 BORDER_WIDTH = 6
+TRAY_ICON = "assets/2.png"
+TRAY_ICON_SIZE = 32
+GAME_POLL_INTERVAL = 2000  # мс, проверка завершения игры в игровом режиме
 TEMP_ICON_FOLDER = os.path.join(tempfile.gettempdir(), "enlaut_icons")
 os.makedirs(TEMP_ICON_FOLDER, exist_ok=True)
 
@@ -30,6 +36,16 @@ class AnimatedBackground(QWidget):
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_rotation)
         self.timer.start(30) 
+
+    def suspend(self):
+        """Останавливает анимацию и освобождает картинку фона"""
+        self.timer.stop()
+        self.pixmap = QPixmap()
+
+    def resume(self):
+        if self.pixmap.isNull():
+            self.pixmap = QPixmap(self.image_path)
+        self.timer.start(30)
         
     def update_rotation(self):
         self.angle = (self.angle - 1) % 360  # Вращение вправо
@@ -104,6 +120,89 @@ class IconExtractor:
         return False
 
 
+class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+    _fields_ = [
+        ("cb", ctypes.c_ulong),
+        ("PageFaultCount", ctypes.c_ulong),
+        ("PeakWorkingSetSize", ctypes.c_size_t),
+        ("WorkingSetSize", ctypes.c_size_t),
+        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+        ("PagefileUsage", ctypes.c_size_t),
+        ("PeakPagefileUsage", ctypes.c_size_t),
+    ]
+
+
+class ProcessStats:
+    """Резидентная память и загрузка CPU самого лаунчера"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.last_cpu = self.cpu_time()
+        self.last_wall = time.monotonic()
+
+    @staticmethod
+    def cpu_time():
+        t = os.times()
+        return t.user + t.system
+
+    @staticmethod
+    def memory_info():
+        """Рабочий набор и частная (выделенная) память процесса в байтах"""
+        try:
+            if sys.platform == "win32":
+                kernel32 = ctypes.windll.kernel32
+                kernel32.GetCurrentProcess.restype = ctypes.c_void_p
+                counters = PROCESS_MEMORY_COUNTERS()
+                counters.cb = ctypes.sizeof(counters)
+                ctypes.windll.psapi.GetProcessMemoryInfo(
+                    ctypes.c_void_p(kernel32.GetCurrentProcess()),
+                    ctypes.byref(counters), counters.cb
+                )
+                return counters.WorkingSetSize, counters.PagefileUsage
+            with open("/proc/self/statm") as f:
+                _, resident, shared = (int(v) for v in f.read().split()[:3])
+            page = os.sysconf("SC_PAGE_SIZE")
+            return resident * page, (resident - shared) * page
+        except Exception as e:
+            print(f"Ошибка чтения памяти процесса: {e}")
+        return 0, 0
+
+    @staticmethod
+    def trim_working_set():
+        """Просит Windows выгрузить из RAM неиспользуемые страницы процесса"""
+        if sys.platform != "win32":
+            return
+        try:
+            kernel32 = ctypes.windll.kernel32
+            kernel32.GetCurrentProcess.restype = ctypes.c_void_p
+            kernel32.SetProcessWorkingSetSize(
+                ctypes.c_void_p(kernel32.GetCurrentProcess()),
+                ctypes.c_size_t(-1), ctypes.c_size_t(-1)
+            )
+        except Exception as e:
+            print(f"Ошибка освобождения памяти: {e}")
+
+    def sample(self):
+        """Возвращает (рабочий набор в МБ, частная память в МБ, средний CPU в % с прошлого замера)"""
+        cpu, wall = self.cpu_time(), time.monotonic()
+        elapsed = wall - self.last_wall
+        cpu_percent = 100.0 * (cpu - self.last_cpu) / elapsed if elapsed > 0 else 0.0
+        self.last_cpu, self.last_wall = cpu, wall
+        rss, private = self.memory_info()
+        return rss / (1024 * 1024), private / (1024 * 1024), cpu_percent
+
+    def report(self, label):
+        rss, private, cpu = self.sample()
+        text = f"{label}: RAM {rss:.1f} МБ, частная {private:.1f} МБ, CPU {cpu:.1f}%"
+        print(text)
+        return text
+
+
 class FavoritesBar(QHBoxLayout):
     def __init__(self, parent):
         super().__init__()
@@ -112,11 +211,14 @@ class FavoritesBar(QHBoxLayout):
         self.setSpacing(8)
         self.refresh_favorites()
 
-    def refresh_favorites(self):
+    def clear_favorites(self):
         while self.count() > 0:
             item = self.takeAt(0)
             if item.widget():
                 item.widget().deleteLater()
+
+    def refresh_favorites(self):
+        self.clear_favorites()
         
         for fav in GameManager.load_favorites():
             btn = QPushButton()
@@ -393,6 +495,14 @@ class GameLauncher(QWidget):
         self.resizing = False
         self.resize_dir = None
         self.selected_game_path = None
+        self.game_process = None
+        self.game_mode_state = None
+        self.tray_icon = None
+        self.full_ui_report = ""
+        self.stats = ProcessStats()
+        self.game_watch_timer = QTimer(self)
+        self.game_watch_timer.setInterval(GAME_POLL_INTERVAL)
+        self.game_watch_timer.timeout.connect(self.check_game_process)
 
         # Создаем анимированный фон для всего окна
         background_image_path = "assets/1.png"
@@ -447,7 +557,7 @@ class GameLauncher(QWidget):
         content_container_layout = QVBoxLayout(content_container)
         content_container_layout.setContentsMargins(0, 0, 0, 0)
         
-        content_splitter = QSplitter(Qt.Horizontal)
+        self.content_splitter = content_splitter = QSplitter(Qt.Horizontal)
         content_splitter.setHandleWidth(1) 
         content_splitter.setChildrenCollapsible(False)
         content_splitter.setStyleSheet("""
@@ -537,12 +647,26 @@ class GameLauncher(QWidget):
             }
         """)
 
+        # Загрузка CPU полного интерфейса считается без работы по построению окна
+        self.stats.reset()
+
     def resizeEvent(self, event):
         """Обновляем размер фона при изменении размера окна"""
         super().resizeEvent(event)
         if hasattr(self, 'background'):
             self.background.setGeometry(0, 0, self.width(), self.height())
 
+    def changeEvent(self, event):
+        """Сворачивание во время игры включает игровой режим, разворачивание без трея — снимает"""
+        super().changeEvent(event)
+        if event.type() != QEvent.WindowStateChange:
+            return
+        if self.isMinimized():
+            if self.game_mode_state is None and self.game_running():
+                QTimer.singleShot(0, self.minimize_to_game_mode)
+        elif self.game_mode_state is not None and self.tray_icon is None:
+            QTimer.singleShot(0, self.restore_from_game_mode)
+
     def show_settings(self):
         QMessageBox.information(self, "Настройки", "Раздел настроек будет добавлен в будущих обновлениях.")
 
@@ -585,9 +709,122 @@ class GameLauncher(QWidget):
             QMessageBox.critical(self, "Ошибка", f"Файл не найден:\n{path}")
             return
         try:
-            subprocess.Popen([path])
+            process = subprocess.Popen([path])
         except Exception as e:
             QMessageBox.critical(self, "Ошибка запуска", str(e))
+            return
+        self.enter_game_mode(process)
+
+    def enter_game_mode(self, process):
+        """Сворачивает лаунчер в трей и освобождает ресурсы интерфейса на время игры"""
+        self.game_process = process
+        if self.game_mode_state is None:
+            self.full_ui_report = self.stats.report("Полный интерфейс")
+            self.game_mode_state = {
+                'geometry': self.saveGeometry(),
+                'maximized': self.isMaximized(),
+                'selected_game_path': self.selected_game_path,
+                'splitter_sizes': self.content_splitter.sizes(),
+            }
+
+            if QSystemTrayIcon.isSystemTrayAvailable():
+                self.hide()
+            else:
+                # Без трея окно остается в панели задач, чтобы его можно было открыть
+                self.showMinimized()
+            if hasattr(self, 'background'):
+                self.background.suspend()
+            self.list_widget.clear()
+            self.favorites_bar.clear_favorites()
+            self.game_details.clear_details()
+            self.show_tray_icon()
+            # Кнопки избранного удаляются через deleteLater, поэтому память
+            # сбрасываем уже после того, как цикл событий их удалит
+            QTimer.singleShot(0, self.release_memory)
+        self.game_watch_timer.start()
+
+    def release_memory(self):
+        if self.game_mode_state is None:
+            return
+        QPixmapCache.clear()
+        ProcessStats.trim_working_set()
+        self.stats.reset()
+
+    def show_tray_icon(self):
+        if not QSystemTrayIcon.isSystemTrayAvailable():
+            return
+        # Исходная картинка 800x800 — в игровом режиме держим только уменьшенную копию
+        icon = QPixmap(TRAY_ICON).scaled(
+            TRAY_ICON_SIZE, TRAY_ICON_SIZE,
+            Qt.KeepAspectRatio, Qt.SmoothTransformation
+        )
+        self.tray_icon = QSystemTrayIcon(QIcon(icon), self)
+        self.tray_icon.setToolTip(f"ENLAUT — игра запущена\n{self.full_ui_report}")
+        menu = QMenu(self)
+        menu.addAction("Открыть ENLAUT", self.restore_from_game_mode)
+        menu.addAction("Выход", QApplication.quit)
+        self.tray_icon.setContextMenu(menu)
+        self.tray_icon.activated.connect(self.on_tray_activated)
+        self.tray_icon.show()
+
+    def on_tray_activated(self, reason):
+        if reason in (QSystemTrayIcon.Trigger, QSystemTrayIcon.DoubleClick):
+            self.restore_from_game_mode()
+
+    def game_running(self):
+        return self.game_process is not None and self.game_process.poll() is None
+
+    def minimize_to_game_mode(self):
+        # Игра могла завершиться между сворачиванием окна и этим вызовом
+        if self.game_mode_state is None and self.game_running():
+            self.enter_game_mode(self.game_process)
+
+    def check_game_process(self):
+        if not self.game_running():
+            self.game_process = None
+            self.game_watch_timer.stop()
+            self.restore_from_game_mode()
+
+    def restore_from_game_mode(self):
+        """Восстанавливает полный интерфейс из снимка, сделанного при запуске игры"""
+        state = self.game_mode_state
+        if state is None:
+            return
+        self.game_mode_state = None
+        if sys.platform == "win32":
+            # Рабочий набор был принудительно сброшен, реальный объем — частная память
+            game_mode_report = self.stats.report("Игровой режим (рабочий набор урезан)")
+        else:
+            game_mode_report = self.stats.report("Игровой режим")
+        self.title_bar.setToolTip(f"{self.full_ui_report}\n{game_mode_report}")
+
+        if self.tray_icon is not None:
+            self.tray_icon.hide()
+            self.tray_icon.contextMenu().deleteLater()
+            self.tray_icon.deleteLater()
+            self.tray_icon = None
+
+        if hasattr(self, 'background'):
+            self.background.resume()
+        self.list_widget.populate_games()
+        self.favorites_bar.refresh_favorites()
+        self.selected_game_path = None
+        for row in range(self.list_widget.count()):
+            item = self.list_widget.item(row)
+            if item.data(Qt.UserRole) == state['selected_game_path']:
+                self.list_widget.setCurrentItem(item)
+                self.display_game_details(item)
+                break
+
+        self.restoreGeometry(state['geometry'])
+        self.content_splitter.setSizes(state['splitter_sizes'])
+        if state['maximized']:
+            self.showMaximized()
+        else:
+            self.showNormal()
+        self.raise_()
+        self.activateWindow()
+        self.stats.reset()
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton: